@@ -1,6 +1,8 @@
 import reference_toolkit.version
-from reference_toolkit.gen_citekeys import gen_citekey
-from reference_toolkit.language_conversion import language_conversion
+from reference_toolkit.gen_citekeys import gen_citekey, gen_citekeys
+from reference_toolkit.language_conversion import language_conversion, \
+    AUTHOR_NFD_TABLE, UNICODE_TO_PLAIN, UNICODE_TO_LATEX, \
+    LATEX_TO_COMBINING, LATEX_TO_PLAIN
 from reference_toolkit.utilities import *
 # get version number
 __version__ = reference_toolkit.version.version
\ No newline at end of file
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-gen_citekeys.py (03/2023)
+gen_citekeys.py (10/2026)
 Generates Papers2-like cite keys for BibTeX
 
 Enter Author names and publication years
@@ -34,6 +34,17 @@ NOTES:
     Check unicode characters with http://www.fileformat.info/
 
 UPDATE HISTORY:
+    Updated 10/2026: convert unicode characters with a single str.translate
+        use zlib crc32 and allow DOIs to be given as bytes
+        scrub titles with a single str.translate pass
+        cache universal citekeys (random citekeys are not cached)
+        use random.choices for generating random citekey suffixes
+        use lookup strings for the characters of citekey hashes
+        remove symbols from authors without encoding and decoding
+        zlib crc32 values are already unsigned 32-bit integers
+        use shared translation table for converting authors to plain text
+        added function for generating citekeys for lists of publications
+        try encoding DOIs as ascii before falling back to utf-8
     Updated 03/2023: use numpy doc syntax for docstrings
     Updated 09/2022: drop python2 compatibility
     Updated 12/2020: using argparse to set command line options
@@ -49,12 +60,33 @@ UPDATE HISTORY:
 from __future__ import print_function
 
 import re
-import math
 import string
 import random
 import argparse
-import binascii
-from reference_toolkit.language_conversion import language_conversion
+import zlib
+import functools
+from reference_toolkit.language_conversion import UNICODE_TO_PLAIN
+
+# translation table for scrubbing special characters from titles
+class _TitleTable(dict):
+    """Keeps lowercase letters, digits and whitespace from titles
+    """
+    def __missing__(self, key):
+        # keep any other whitespace characters and drop the rest
+        self[key] = key if chr(key).isspace() else None
+        return self[key]
+
+_TRANS_TITLE = _TitleTable({ord(c): ord(c) for c in string.ascii_lowercase})
+_TRANS_TITLE.update({ord(c): ord(c) for c in string.digits})
+_TRANS_TITLE.update({ord(c): ord(' ') for c in '_-=/|.{}'})
+
+# regular expression for removing whitespace, dashes and apostrophes
+_AUTHOR_SYMBOLS_RE = re.compile(r'[\s\-\']')
+
+# characters for the hashes of universal citekeys
+# DOI-based: b-k followed by a-z, title-based: t-w followed by a-z
+_DOI_HASH = string.ascii_lowercase[1:11]
+_TITLE_HASH = string.ascii_lowercase[19:23]
 
 # PURPOSE: create a Papers2-like cite key using the DOI
 def gen_citekey(author, year, doi, title):
@@ -66,45 +98,79 @@ def gen_citekey(author, year, doi, title):
         Surname of lead author of publication
     year: str
         Corresponding publication year
-    doi: str
+    doi: str or bytes
         Digital Object Identifier (DOI) of the publication
     title: str
         Corresponding publication title
     """
-    # 1st column: latex, 2nd: combining unicode, 3rd: unicode, 4th: plain text
-    for LV, CV, UV, PV in language_conversion():
-        author = author.replace(UV, PV)
-    # replace symbols
-    author = re.sub(br'\s|\-|\'', br'', author.encode('utf-8')).decode('utf-8')
-
     # create citekey suffix first attempting:
     # a DOI-based universal citekey
     # then attempting a title-based universal citekey
+    if doi or title:
+        return _universal_citekey(author, year, doi, title)
     # finally generating a random citekey (non-universal)
+    key = ''.join(random.choices(string.ascii_lowercase, k=2))
+    # return the final citekey from the function
+    return f'{_author_key(author)}:{year}{key}'
+
+# PURPOSE: create Papers2-like cite keys for lists of publications
+def gen_citekeys(authors, years, dois=None, titles=None):
+    """Generates Papers2-like cite keys for lists of publications
+
+    Parameters
+    ----------
+    authors: list
+        Surnames of lead authors of publications
+    years: list
+        Corresponding publication years
+    dois: list or NoneType, default None
+        Digital Object Identifiers (DOIs) of the publications
+    titles: list or NoneType, default None
+        Corresponding publication titles
+    """
+    # if not using DOIs or titles to set citekeys
+    dois = [None]*len(authors) if dois is None else dois
+    titles = [None]*len(authors) if titles is None else titles
+    # generate citekey for each publication
+    return [gen_citekey(A, Y, D, T) for A, Y, D, T in
+        zip(authors, years, dois, titles)]
+
+# PURPOSE: convert the surname of the lead author for cite keys
+def _author_key(author):
+    # convert unicode characters to plain text in a single pass
+    author = author.translate(UNICODE_TO_PLAIN)
+    # replace symbols
+    return _AUTHOR_SYMBOLS_RE.sub('', author)
+
+# PURPOSE: create (and cache) a universal cite key from the DOI or title
+@functools.lru_cache(maxsize=4096)
+def _universal_citekey(author, year, doi, title):
     if doi:
-        # convert to unsigned 32-bit int if needed
-        crc = binascii.crc32(doi.encode('utf-8')) & 0xffffffff
+        # encode as bytes if needed (DOIs are typically ascii)
+        if not isinstance(doi, bytes):
+            try:
+                doi = doi.encode('ascii')
+            except UnicodeEncodeError:
+                doi = doi.encode('utf-8')
+        # calculate unsigned 32-bit checksum (CRC-32/ISO-HDLC)
+        crc = zlib.crc32(doi)
         # generate individual hashes
-        hash1 = chr(int(ord('b') + math.floor((crc % (10*26))/26)))
-        hash2 = chr(int(ord('a') + (crc % 26)))
+        hash1 = _DOI_HASH[(crc % (10*26))//26]
+        hash2 = string.ascii_lowercase[crc % 26]
         # concatenate to form DOI-based universal citekey suffix
         key = hash1 + hash2
-    elif title:
+    else:
         # scrub special characters from title and set as lowercase
-        title = re.sub(r'[\_\-\=\/\|\.\{\}]', ' ', title.lower())
-        title = ''.join(re.findall(r'[a-zA-Z0-9\s]', title))
-        # convert to unsigned 32-bit int if needed
-        crc = binascii.crc32(title.strip().encode('utf-8')) & 0xffffffff
+        title = title.lower().translate(_TRANS_TITLE)
+        # calculate unsigned 32-bit checksum (CRC-32/ISO-HDLC)
+        crc = zlib.crc32(title.strip().encode('utf-8'))
         # generate individual hashes
-        hash1 = chr(int(ord('t') + math.floor((crc % (4*26))/26)))
-        hash2 = chr(int(ord('a') + (crc % 26)))
+        hash1 = _TITLE_HASH[(crc % (4*26))//26]
+        hash2 = string.ascii_lowercase[crc % 26]
         # concatenate to form title-based universal citekey suffix
         key = hash1 + hash2
-    else:
-        key = ''.join(random.sample(string.ascii_lowercase, 2))
-
     # return the final citekey from the function
-    return f'{author}:{year}{key}'
+    return f'{_author_key(author)}:{year}{key}'
 
 # PURPOSE: create argument parser
 def arguments():
@@ -134,17 +200,10 @@ def main():
     parser = arguments()
     args = parser.parse_args()
 
-    # if not using DOIs to set citekeys
-    if args.doi is None:
-        args.doi = [None]*len(args.author)
-    # if not using titles to set citekeys
-    if args.title is None:
-        args.title = [None]*len(args.author)
-
     # run for each author-year pair
-    for A, Y, D, T in zip(args.author, args.year, args.doi, args.title):
-        citekey = gen_citekey(A, Y, D, T)
-        print(citekey)
+    citekeys = gen_citekeys(args.author, args.year,
+        dois=args.doi, titles=args.title)
+    print('\n'.join(citekeys))
 
 # run main program
 if __name__ == '__main__':
@@ -1,9 +1,20 @@
 #!/usr/bin/env python
 u"""
-utilities.py (11/2023)
+utilities.py (10/2026)
 Reads the supplied referencerc file for default file path and file format
 
 UPDATE HISTORY:
+    Updated 10/2026: start unique filename search after the largest existing
+        numerical instance rather than probing each instance in turn
+        cache parameters read from referencerc files
+        refresh cached referencerc parameters if the file is modified
+        parse referencerc lines with str.partition rather than regex
+        find package path from module file rather than the current frame
+        intern parameter names and values read from referencerc files
+        create unique files with exclusive opens of string paths
+        create the default ssl context on first use rather than at import
+        added function for reading journal abbreviations files
+        can suppress printing unique filenames for threaded callers
     Updated 11/2023: updated ssl context to fix deprecation errors
     Updated 05/2023: use pathlib to find and operate on paths
         added more file operation functions and renamed to utilities.py
@@ -14,13 +25,17 @@ UPDATE HISTORY:
 """
 from __future__ import annotations
 
+import os
 import sys
 import re
 import ssl
-import inspect
 import pathlib
+import functools
 import urllib.request
 
+# absolute path of the package directory
+_PKG_DIR = pathlib.Path(__file__).absolute().parent
+
 # PURPOSE: get absolute path within a package from a relative path
 def get_data_path(relpath: list | str | pathlib.Path):
     """
@@ -31,14 +46,11 @@ def get_data_path(relpath: list | str | pathlib.Path):
     relpath: list, str or pathlib.Path
         relative path
     """
-    # current file path
-    filename = inspect.getframeinfo(inspect.currentframe()).filename
-    filepath = pathlib.Path(filename).absolute().parent
     if isinstance(relpath, list):
         # use *splat operator to extract from list
-        return filepath.joinpath(*relpath)
+        return _PKG_DIR.joinpath(*relpath)
     elif isinstance(relpath, (str, pathlib.Path)):
-        return filepath.joinpath(relpath)
+        return _PKG_DIR.joinpath(relpath)
 
 # PURPOSE: read referencerc file and extract parameters
 def read_referencerc(referencerc_file: str | pathlib.Path):
@@ -49,41 +61,99 @@ def read_referencerc(referencerc_file: str | pathlib.Path):
     referencerc_file: str
         path to referencerc file for setting parameters
     """
+    referencerc_file = pathlib.Path(referencerc_file).expanduser().absolute()
+    # parameters are cached until the referencerc file is modified
+    mtime = referencerc_file.stat().st_mtime_ns
+    return _parse_referencerc(referencerc_file, mtime)
+
+# PURPOSE: parse referencerc file for a given modification time
+@functools.lru_cache(maxsize=16)
+def _parse_referencerc(referencerc_file: pathlib.Path, mtime: int):
     # variable with parameter definitions
     parameters = {}
     # Opening parameter file and assigning file ID (f)
-    referencerc_file = pathlib.Path(referencerc_file).expanduser().absolute()
     with referencerc_file.open(mode='r', encoding='utf8') as f:
-        # read entire line and keep all uncommented lines
-        fin = [i for i in f.readlines() if i and re.match(r'^(?!\#|\n)', i)]
-    # for each line in the file will extract the parameter (name and value)
-    for fileline in fin:
-        # Splitting the input line between parameter name and value
-        part = fileline.split(':')
-        # filling the parameter definition variable
-        parameters[part[0].strip()] = part[1].strip()
+        # for each line will extract the parameter (name and value)
+        for fileline in f:
+            # skip empty and commented lines
+            fileline = fileline.strip()
+            if not fileline or fileline.startswith('#'):
+                continue
+            # Splitting the input line between parameter name and value
+            name, _, value = fileline.partition(':')
+            # filling the parameter definition variable
+            parameters[sys.intern(name.strip())] = sys.intern(value.strip())
     # return the file path and file format
     datapath = pathlib.Path(parameters['datapath']).expanduser().absolute()
     dataformat = str(parameters['dataformat'])
     return datapath, dataformat
 
+# PURPOSE: read a journal abbreviations file (cached for each process)
+@functools.lru_cache(maxsize=4)
+def read_journal_abbreviations(abbreviation_file: str | pathlib.Path):
+    """
+    Read a journal abbreviations file into a dictionary mapping
+    lowercase journal names to abbreviations
+
+    Parameters
+    ----------
+    abbreviation_file: str or pathlib.Path
+        path to journal abbreviations file
+    """
+    abbreviation_file = pathlib.Path(abbreviation_file).expanduser().absolute()
+    abbreviations = {}
+    with abbreviation_file.open(mode="r", encoding="utf8") as f:
+        for line in f:
+            # skip commented lines
+            if line.startswith('#'):
+                continue
+            # split the line between journal name and abbreviation
+            name, sep, abbreviation = line.partition('=')
+            if sep:
+                # collapse whitespace within the journal name
+                key = ' '.join(name.split()).lower()
+                # use the first listed abbreviation for each journal
+                abbreviations.setdefault(key, abbreviation.strip())
+    return abbreviations
+
 # PURPOSE: open a unique filename adding a numerical instance if existing
-def create_unique_filename(filename: str | pathlib.Path):
-    # create counter to add to the end of the filename if existing
-    counter = 1
+def create_unique_filename(
+        filename: str | pathlib.Path,
+        VERBOSE: bool = True
+    ):
+    """
+    Open a unique filename adding a numerical instance if existing
+
+    Parameters
+    ----------
+    filename: str or pathlib.Path
+        output filename
+    VERBOSE: bool, default True
+        print the unique filename
+    """
     filename = pathlib.Path(filename).expanduser().absolute()
-    while counter:
+    parent, stem, suffix = (str(filename.parent), filename.stem, filename.suffix)
+    # counter to add to the end of the filename if existing
+    counter = None
+    unique_filename = str(filename)
+    while True:
         try:
             # open file descriptor only if the file doesn't exist
-            fd = filename.open(mode='xb')
-        except OSError:
+            fd = open(unique_filename, mode='xb')
+        except FileExistsError:
             pass
         else:
-            print(str(compressuser(filename)))
+            print(str(compressuser(unique_filename))) if VERBOSE else None
             return fd
+        # find the largest existing numerical instance of the filename
+        if counter is None:
+            rx = re.compile(rf'{re.escape(stem)}-(\d+){re.escape(suffix)}$')
+            instances = [int(m.group(1)) for m in
+                map(rx.match, os.listdir(parent)) if m]
+            counter = max(instances, default=0)
         # new filename adds counter the between fileBasename and fileExtension
-        filename = filename.with_name(f'{filename.stem}-{counter:d}{filename.suffix}')
         counter += 1
+        unique_filename = os.path.join(parent, f'{stem}-{counter:d}{suffix}')
 
 def compressuser(filename: str | pathlib.Path):
     """
@@ -129,14 +199,18 @@ def _set_ssl_context_options(context: ssl.SSLContext) -> None:
         context.options |= ssl.OP_NO_TLSv1
         context.options |= ssl.OP_NO_TLSv1_1
 
-# default ssl context
-_default_ssl_context = _create_ssl_context_no_verify()
+# PURPOSE: create (and cache) the default ssl context on first use
+@functools.lru_cache(maxsize=None)
+def _get_default_ssl_context() -> ssl.SSLContext:
+    """Gets the default SSL context for unverified connections
+    """
+    return _create_ssl_context_no_verify()
 
 # PURPOSE: check internet connection and URL
 def check_connection(
         HOST: str,
         timeout: int | None = 20,
-        context: ssl.SSLContext = _default_ssl_context,
+        context: ssl.SSLContext | None = None,
     ):
     """
     Check internet connection with http host
@@ -147,9 +221,13 @@ def check_connection(
         remote http host
     timeout: int
         timeout in seconds for blocking operations
-    context: obj, default reference_toolkit.utilities._default_ssl_context
+    context: obj or NoneType, default None
         SSL context for ``urllib`` opener object
+
+        Default is ``reference_toolkit.utilities._get_default_ssl_context()``
     """
+    # use the default ssl context if not given
+    context = context or _get_default_ssl_context()
     # attempt to connect to remote url
     try:
         urllib.request.urlopen(HOST,
@@ -40,7 +40,6 @@ setup(
     ],
     keywords=keywords,
     packages=find_packages(),
-    install_requires=['future'],
     scripts=scripts,
     include_package_data=True,
 )
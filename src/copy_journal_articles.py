@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-copy_journal_articles.py (11/2023)
+copy_journal_articles.py (10/2026)
 Copies journal articles and supplements from a website to a local directory
 
 Enter Author names, journal name, publication year and volume will copy a pdf
@@ -13,8 +13,11 @@ CALLING SEQUENCE:
 
     will download the copy to 2008/Rignot/Rignot_Nat._Geosci.-1_2008.pdf
 
+    publication information can be listed once for all urls or
+    repeated for each url in order
+
 INPUTS:
-    url to file to be copied into the reference path
+    url(s) to file(s) to be copied into the reference path
 
 COMMAND LINE OPTIONS:
     -A X, --author X: lead author of publication
@@ -35,6 +38,21 @@ NOTES:
         unicode characters with http://www.fileformat.info/
 
 UPDATE HISTORY:
+    Updated 10/2026: read journal abbreviations file once per process
+        parse abbreviations into a dictionary for journal name lookups
+        precompile regular expression for scrubbing url query strings
+        download multiple urls concurrently using a thread pool
+        increase chunk size for copying remote files to 128 KiB
+        convert author names with a single cached translation table
+        read referencerc file once for all downloads
+        report failed downloads instead of checking each connection first
+        create argument parser in separate function
+        can set publication information for each of multiple urls
+        copy directly from the buffered response within a context manager
+        use prebuilt translation table for converting author names
+        use the default ssl context created on first use
+        use shared reader for the journal abbreviations file
+        print messages from the main thread and report all failed urls
     Updated 11/2023: updated ssl context to fix deprecation errors
     Updated 05/2023: use pathlib to find and operate on paths
     Updated 09/2022: drop python2 compatibility
@@ -52,47 +70,49 @@ import re
 import shutil
 import pathlib
 import argparse
+import concurrent.futures
+import urllib.error
 import urllib.request
 import reference_toolkit
 
+# regular expression for scrubbing additional html information from urls
+_QS_RE = re.compile(r'\?[\_a-z]{1,4}\=(.*?)$')
+
 # PURPOSE: create directories and copy a reference file after formatting
-def copy_journal_articles(remote,author,journal,year,volume,number,SUPPLEMENT):
+def copy_journal_articles(remote,author,journal,year,volume,number,SUPPLEMENT,
+    DATAPATH=None, DATAFORMAT=None):
     # get reference filepath and reference format from referencerc file
-    referencerc = reference_toolkit.get_data_path(['assets','.referencerc'])
-    datapath, dataformat = reference_toolkit.read_referencerc(referencerc)
+    if (DATAPATH is None) or (DATAFORMAT is None):
+        referencerc = reference_toolkit.get_data_path(['assets','.referencerc'])
+        DATAPATH, DATAFORMAT = reference_toolkit.read_referencerc(referencerc)
     # input remote file scrubbed of any additional html information
-    fi = pathlib.Path(re.sub(r'\?[\_a-z]{1,4}\=(.*?)$','',remote))
+    fi = pathlib.Path(_QS_RE.sub('',remote))
     # get extension from file (assume pdf if extension cannot be extracted)
     fileExtension = fi.suffix if fi.suffix else '.pdf'
+    # messages to print from the main thread
+    output = []
 
     # file listing journal abbreviations modified from
     # https://github.com/JabRef/abbrv.jabref.org/tree/master/journals
     abbreviation_file = reference_toolkit.get_data_path(['assets',
         'journal_abbreviations_webofscience-ts.txt'])
-    # create regular expression pattern for extracting abbreviations
-    arg = journal.replace(' ',r'\s+')
-    rx = re.compile(rf'\n{arg}[\s+]?\=[\s+]?(.*?)\n', flags=re.IGNORECASE)
     # try to find journal article within filename from webofscience file
-    with abbreviation_file.open(mode="r", encoding="utf8") as f:
-        abbreviation_contents = f.read()
-
+    key = ' '.join(journal.split()).lower()
+    abbreviation = reference_toolkit.read_journal_abbreviations(
+        abbreviation_file).get(key)
     # if abbreviation not found: just use the whole journal name
-    # else use the found journal abbreviation
-    if not bool(rx.search(abbreviation_contents)):
-        print(f'Abbreviation for {journal} not found')
+    if abbreviation is None:
+        output.append(f'Abbreviation for {journal} not found')
         abbreviation = journal
-    else:
-        abbreviation = rx.findall(abbreviation_contents)[0]
 
-    # 1st column: latex, 2nd: combining unicode, 3rd: unicode, 4th: plain text
-    for LV, CV, UV, PV in reference_toolkit.language_conversion():
-        author = author.replace(UV, CV)
+    # replace unicode characters in author with combining unicode
+    author = author.translate(reference_toolkit.AUTHOR_NFD_TABLE)
 
     # directory path for local file
     if SUPPLEMENT:
-        directory = datapath.joinpath(year,author,'Supplemental')
+        directory = DATAPATH.joinpath(year,author,'Supplemental')
     else:
-        directory = datapath.joinpath(year,author)
+        directory = DATAPATH.joinpath(year,author)
     # check if output directory currently exist and recursively create if not
     directory.mkdir(parents=True, exist_ok=True)
 
@@ -107,22 +127,26 @@ def copy_journal_articles(remote,author,journal,year,volume,number,SUPPLEMENT):
     # initial test case for output file (will add numbers if not unique in fs)
     args = (author, journal.replace(' ','_'), abbreviation.replace(' ','_'),
         volume, number, year, fileExtension)
-    local_file = directory.joinpath(dataformat.format(*args))
+    local_file = directory.joinpath(DATAFORMAT.format(*args))
     # chunked transfer encoding size
-    CHUNK = 16 * 1024
+    CHUNK = 128 * 1024
     # open url and copy contents to local file using chunked transfer encoding
     # transfer should work properly with ascii and binary data formats
     headers = {'User-Agent':"Magic Browser"}
     request = urllib.request.Request(remote, headers=headers)
-    context = reference_toolkit.utilities._default_ssl_context
-    f_in = urllib.request.urlopen(request, timeout=20, context=context)
-    with reference_toolkit.create_unique_filename(local_file) as f_out:
-        shutil.copyfileobj(f_in, f_out, CHUNK)
-    f_in.close()
-
-# main program that calls copy_journal_articles()
-def main():
-    # Read the system arguments listed after the program
+    context = reference_toolkit.utilities._get_default_ssl_context()
+    # http responses read from a buffered socket file and can be copied
+    # directly without an additional buffered reader
+    with urllib.request.urlopen(request, timeout=20, context=context) as f_in, \
+        reference_toolkit.create_unique_filename(local_file,
+            VERBOSE=False) as f_out:
+            shutil.copyfileobj(f_in, f_out, CHUNK)
+    output.append(str(reference_toolkit.compressuser(f_out.name)))
+    # return the messages for the downloaded file
+    return '\n'.join(output)
+
+# PURPOSE: create argument parser
+def arguments():
     parser = argparse.ArgumentParser(
         description="""Copies a journal article from a website to the reference
             local directory
@@ -130,26 +154,61 @@ def main():
     )
     # command line parameters
     parser.add_argument('url',
-        type=str, help='url to article to be copied into the reference path')
+        type=str, nargs='+',
+        help='url to article to be copied into the reference path')
     parser.add_argument('--author','-A',
-        type=str, help='Lead author of publication')
+        type=str, action='append', help='Lead author of publication')
     parser.add_argument('--journal','-J',
-        type=str, help='Corresponding publication journal')
+        type=str, action='append', help='Corresponding publication journal')
     parser.add_argument('--year','-Y',
-        type=str, help='Corresponding publication year')
+        type=str, action='append', help='Corresponding publication year')
     parser.add_argument('--volume','-V',
-        type=str, default='', help='Corresponding publication volume')
+        type=str, action='append', help='Corresponding publication volume')
     parser.add_argument('--number','-N',
-        type=str, default='', help='Corresponding publication number')
+        type=str, action='append', help='Corresponding publication number')
     parser.add_argument('--supplement','-S',
         default=False, action='store_true',
         help='File is an article supplement')
+    # return the parser
+    return parser
+
+# main program that calls copy_journal_articles()
+def main():
+    # Read the system arguments listed after the program
+    parser = arguments()
     args = parser.parse_args()
 
-    # check connection to url and then download article
-    if reference_toolkit.check_connection(args.url):
-        copy_journal_articles(args.url, args.author, args.journal, args.year,
-            args.volume, args.number, args.supplement)
+    # use publication information for all urls if only listed once
+    defaults = dict(author=None, journal=None, year=None, volume='', number='')
+    for key, default in defaults.items():
+        values = getattr(args, key) or [default]
+        if (len(values) == 1):
+            setattr(args, key, values*len(args.url))
+        elif (len(values) != len(args.url)):
+            parser.error(f'--{key} must be listed once or for each url')
+
+    # get reference filepath and reference format from referencerc file
+    referencerc = reference_toolkit.get_data_path(['assets','.referencerc'])
+    datapath, dataformat = reference_toolkit.read_referencerc(referencerc)
+
+    # download articles concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        # download article from each url
+        futures = {executor.submit(copy_journal_articles, url, A, J, Y, V, N,
+            args.supplement, DATAPATH=datapath, DATAFORMAT=dataformat): url
+            for url, A, J, Y, V, N in zip(args.url, args.author, args.journal,
+                args.year, args.volume, args.number)}
+        # print messages and report any failed downloads
+        for future in concurrent.futures.as_completed(futures):
+            url = futures[future]
+            try:
+                print(future.result())
+            except urllib.error.HTTPError as exc:
+                print(f'Check URL: {url} ({exc})')
+            except urllib.error.URLError as exc:
+                print(f'Check internet connection: {url} ({exc.reason})')
+            except Exception as exc:
+                print(f'Failed to copy {url}: {exc}')
 
 # run main program
 if __name__ == '__main__':
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-export_library.py (05/2023)
+export_library.py (10/2026)
 Exports library of individual BibTeX files into a single sorted BibTeX file
 
 CALLING SEQUENCE:
@@ -17,6 +17,16 @@ PROGRAM DEPENDENCIES:
     utilities.py: Sets default file path and file format for output files
 
 UPDATE HISTORY:
+    Updated 10/2026: compile BibTeX entry regular expression at import
+        compile year directory regular expression at import
+        check for BibTeX files using suffix (escapes the extension period)
+        use os.scandir to list directories with cached file types
+        extract entry type and citekey from the first match of each file
+        read BibTeX files concurrently using a thread pool
+        use operator.attrgetter for sorting entries instead of eval
+        use __slots__ for BibTeX entry attributes
+        write sorted entries with a single writelines call
+        sort entries by citekey within each year or entry type
     Updated 05/2023: use pathlib to find and operate on paths
     Updated 12/2020: using argparse to set command line options
     Written 02/2018
@@ -24,14 +34,28 @@ UPDATE HISTORY:
 from __future__ import print_function
 
 import sys
+import os
 import re
 import time
 import pathlib
 import argparse
+import operator
+import concurrent.futures
 import reference_toolkit
 
+# valid BibTeX entry types
+bibtex_entry_types = ['article','book','booklet','conference','inbook',
+    'incollection','inproceedings','manual','mastersthesis','phdthesis',
+    'proceedings','techreport','unpublished','webpage']
+# regular expression for extracting BibTeX entry types and citekeys
+entry_regex = r'[?<=\@](' + r'|'.join(bibtex_entry_types) + r')\{(.*?),'
+_ENTRY_RE = re.compile(entry_regex, flags=re.IGNORECASE)
+# regular expression for finding yearly directories
+_YEAR_RE = re.compile(r'\d+')
+
 # PURPOSE: create a named list with named attributes for each BibTeX entry
 class BibTeX:
+    __slots__ = ('citekey', 'year', 'type', 'entry')
     def __init__(self, citekey, year, type, entry):
         self.citekey = citekey
         self.year = year
@@ -40,18 +64,17 @@ class BibTeX:
     def __repr__(self):
         return repr((self.citekey, self.year, self.type, self.entry))
 
+# PURPOSE: read the contents of a BibTeX file
+def _read_file(bibtex_file):
+    with bibtex_file.open(mode="r", encoding="utf-8") as f:
+        return f.read()
+
 # Reads BibTeX files for each article stored in the working directory
 # exports as a single file sorted by BibTeX key
-def export_library(SORT=None, EXPORT=None):
+def export_library(SORT='author', EXPORT=None):
     # get reference filepath and reference format from referencerc file
     referencerc = reference_toolkit.get_data_path(['assets','.referencerc'])
     datapath, dataformat = reference_toolkit.read_referencerc(referencerc)
-    # valid BibTeX entry types
-    bibtex_entry_types = ['article','book','booklet','conference','inbook',
-        'incollection','inproceedings','manual','mastersthesis','phdthesis',
-        'proceedings','techreport','unpublished','webpage']
-    entry_regex = r'[?<=\@](' + r'|'.join(bibtex_entry_types) + r')\{(.*?),'
-    R1 = re.compile(entry_regex, flags=re.IGNORECASE)
 
     # if exporting to a single file or standard output
     if EXPORT:
@@ -60,42 +83,46 @@ def export_library(SORT=None, EXPORT=None):
     else:
         fid = sys.stdout
 
-    # sorting operators
-    if (SORT == 'author'):
-        sorting_operator = 'lambda self: self.citekey'
-    elif (SORT == 'year'):
-        sorting_operator = 'lambda self: self.year'
-    elif (SORT == 'type'):
-        sorting_operator = 'lambda self: self.type'
-
-    # Python list with all BibTeX entries
-    bibtex_entries = []
+    # Python list with all BibTeX files and their yearly directories
+    bibtex_files = []
     # iterate over yearly directories
-    years = [sd for sd in datapath.iterdir() if
-        re.match(r'\d+',sd.name) and sd.is_dir()]
+    with os.scandir(datapath) as entries:
+        years = [pathlib.Path(sd.path) for sd in entries if
+            _YEAR_RE.match(sd.name) and sd.is_dir()]
     for Y in sorted(years):
         # find author directories in year
-        authors = [sd for sd in Y.iterdir() if sd.is_dir()]
+        with os.scandir(Y) as entries:
+            authors = [pathlib.Path(sd.path) for sd in entries if sd.is_dir()]
         for A in sorted(authors):
             # find BibTeX files within author directory
-            bibtex_files = [fi for fi in A.iterdir()
-                if re.match(r'(.*?)-(.*?).bib$',fi.name)]
-            # read each BibTeX file
-            for bibtex_file in bibtex_files:
-                with bibtex_file.open(mode="r", encoding="utf-8") as f:
-                    bibtex_entry = f.read()
-                # extract BibTeX citekeys
-                bibtype,bibkey = R1.findall(bibtex_entry.lower()).pop()
-                # add BibTeX entry to list with named attributes
-                bibtex_entries.append(BibTeX(bibkey,Y,bibtype,bibtex_entry))
+            with os.scandir(A) as entries:
+                bibtex_files.extend((Y,pathlib.Path(fi.path)) for fi in entries
+                    if fi.name.endswith('.bib') and ('-' in fi.name[:-4]))
+
+    # Python list with all BibTeX entries
+    bibtex_entries = []
+    # read each BibTeX file using a pool of threads
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        contents = executor.map(_read_file, [fi for Y,fi in bibtex_files])
+        for (Y,bibtex_file),bibtex_entry in zip(bibtex_files,contents):
+            # extract BibTeX entry type and citekey (as lowercase)
+            bibtype,bibkey = _ENTRY_RE.search(bibtex_entry).groups()
+            bibtype,bibkey = bibtype.lower(),bibkey.lower()
+            # add BibTeX entry to list with named attributes
+            bibtex_entries.append(BibTeX(bibkey,Y,bibtype,bibtex_entry))
 
     # print header with date created and total number of BibTeX entries
     print(time.strftime('%%%% BibTeX File Created on %Y-%m-%d',
         time.localtime()), file=fid)
     print('%% Number of Entries: {0:d}\n'.format(len(bibtex_entries)), file=fid)
-    # sort by the chosen operator and print to file
-    for key in sorted(bibtex_entries, key=eval(sorting_operator)):
-        print(key.entry, file=fid)
+    # sort by citekey and then by the chosen operator (if not author)
+    # stable sorting will keep entries ordered by citekey within groups
+    sorting_attributes = dict(author='citekey', year='year', type='type')
+    bibtex_entries.sort(key=operator.attrgetter('citekey'))
+    if (SORT != 'author'):
+        bibtex_entries.sort(key=operator.attrgetter(sorting_attributes[SORT]))
+    # print sorted entries to file
+    fid.writelines(f'{key.entry}\n' for key in bibtex_entries)
 
     # close the exported BibTeX file
     fid.close() if EXPORT else None
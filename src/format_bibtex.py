@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-format_bibtex.py (05/2023)
+format_bibtex.py (10/2026)
 Reformats journal bibtex files into a standard form with Universal citekeys
 
 COMMAND LINE OPTIONS:
@@ -22,6 +22,23 @@ NOTES:
         https://github.com/cparnot/universal-citekey-js
 
 UPDATE HISTORY:
+    Updated 10/2026: compile regular expressions once at module scope
+        convert unicode characters with single str.translate passes
+        convert latex symbols with a single regular expression pass
+        normalize authors and titles to composed unicode characters
+        extract entry type and fields in a single scan of the file
+        sort output fields by their dictionary items
+        search compound surnames with a for loop over compiled patterns
+        format multiple input files in parallel using a pool of processes
+        build the output bibtex citation and write it with a single print
+        escape ampersands with a single backslash (fixes doubled backslashes)
+        pass the first author as a string without encoding and decoding
+        place output fields into slots by their output order
+        lowercase field names once for each field
+        use shared translation tables for converting unicode characters
+        use shared mappings for converting latex symbols
+        return formatted text to print in input order when running in parallel
+        skip latex symbols that convert to themselves when matching symbols
     Updated 05/2023: use pathlib to find and operate on paths
     Updated 09/2022: drop python2 compatibility
     Updated 12/2020: using argparse to set command line options
@@ -39,73 +56,129 @@ UPDATE HISTORY:
 """
 from __future__ import print_function
 
-import sys
 import re
 import pathlib
 import argparse
+import functools
+import unicodedata
+import concurrent.futures
 import reference_toolkit
 
+# valid bibtex entry types
+bibtex_entry_types = ['article','book','booklet','conference','inbook',
+    'incollection','inproceedings','manual','mastersthesis','phdthesis',
+    'proceedings','techreport','unpublished','webpage']
+entry_regex = r'[?<=\@](?P<entrytype>' + '|'.join(bibtex_entry_types) + \
+    r')[\s]?\{(?P<citekey>.*?)[\s]?,[\s]?'
+# bibtex fields to be printed in the output file
+bibtex_field_types = ['address','affiliation','annote','author','booktitle',
+    'chapter','crossref','doi','edition','editor','howpublished','institution',
+    'isbn','issn','journal','key','keywords','month','note','number','organization',
+    'pages','publisher','school','series','title','type','url','volume','year']
+field_regex = r'[\s]?(?P<field>' + r'|'.join(bibtex_field_types) + \
+    r')[\s]?\=[\s]?[\"|\']?[\{]?[\{]?[\s]?(?P<value>.*?)[\s+]?[\}]?[\}]?[\"|\']?[\s]?[\,]?[\s]?\n'
+# extract entry type, cite key and fields in a single scan of the file
+_BIBTEX_RE = re.compile(r'|'.join([entry_regex, field_regex]),
+    flags=re.IGNORECASE)
+# sort bibtex fields in output files
+bibtex_field_sort = {'address':15,'affiliation':16,'annote':25,'author':0,
+    'booktitle':12,'chapter':13,'crossref':27,'doi':10,'edition':19,'editor':21,
+    'howpublished':22,'institution':17,'isbn':8,'issn':7,'journal':2,'key':24,
+    'keywords':28,'month':4,'note':23,'number':6,'organization':17,'pages':11,
+    'publisher':14,'school':18,'series':20,'title':1,'type':26,'url':9,
+    'volume':5,'year':3}
+# unique output slot for each field (fields with the same index are alphabetical)
+_FIELD_SLOTS = {k:i for i,k in enumerate(sorted(bibtex_field_sort,
+    key=lambda k: (bibtex_field_sort[k], k)))}
+# regular expression pattern to extract doi from webpages or "doi:"
+doi_regex = r'(doi\:[\s]?|http[s]?\:\/\/(dx\.)?doi\.org\/)?(10\.(.*?))$'
+_DOI_RE = re.compile(doi_regex, flags=re.IGNORECASE)
+
+# list of known compound surnames to search for
+compound_surname_regex = []
+compound_surname_regex.append(r'(?<=\s)van\s[de|den]?[\s]?(.*?)')
+compound_surname_regex.append(r'(?<=\s)von\s[de|den]?[\s]?(.*?)')
+compound_surname_regex.append(r'(?<![van|von])(?<=\s)de\s(.*?)')
+compound_surname_regex.append(r'(?<!de)(?<=\s)(la|los)\s?(.*?)')
+_COMPOUND_SURNAME_RE = [re.compile(regex, flags=re.IGNORECASE)
+    for regex in compound_surname_regex]
+
+# regular expressions for splitting between authors and separating initials
+_AUTHORS_RE = re.compile(r' and ', flags=re.IGNORECASE)
+_INITIALS2_RE = re.compile(r'([A-Z])\.([A-Z])\.')
+_INITIALS_MIXED_RE = re.compile(r'([A-Za-z]+)\s([A-Z])\.')
+_INITIALS1_RE = re.compile(r'([A-Z])\.')
+# regular expression for page ranges
+_PAGES_RE = re.compile(r'(.*?)\s\-\s(.*?)$')
+# regular expressions for scrubbing whitespace and symbols
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPACE_RE = re.compile(r'\s')
+_DASH_APOSTROPHE_RE = re.compile(r'\-|\'')
+_TRAILING_WHITESPACE_RE = re.compile(r'(\s+)\n')
+# regular expression for ampersands that are not in latex format
+_AMPERSAND_RE = re.compile(r'(?<=\s)\&')
+# regular expressions for parsing years and universal citekeys
+_YEAR_RE = re.compile(r'\d+')
+_CITEKEY_RE = re.compile(r'(\D+)\:(\d+\D+)')
+
+# multiple character latex symbols that cannot be translated
+# matched in a single pass with the alternatives in conversion order
+# symbols that convert to themselves are skipped so that they do not
+# block longer symbols starting with the same characters (' and '')
+def _latex_regex(mapping):
+    return re.compile(r'|'.join(re.escape(LV) for LV, V in mapping.items()
+        if (LV != V)))
+_LATEX_PLAIN_RE = _latex_regex(reference_toolkit.LATEX_TO_PLAIN)
+_LATEX_COMBINING_RE = _latex_regex(reference_toolkit.LATEX_TO_COMBINING)
+
+# PURPOSE: replace latex symbols using a conversion mapping
+def _replace_latex(text, R, mapping):
+    return R.sub(lambda m: mapping[m.group(0)], text)
+
+# PURPOSE: separate initials of given names if listed as a single variable
+def _split_initials(AGN):
+    if _INITIALS2_RE.match(AGN):
+        return ' '.join(_INITIALS2_RE.findall(AGN).pop())
+    elif _INITIALS_MIXED_RE.match(AGN):
+        return ' '.join(_INITIALS_MIXED_RE.findall(AGN).pop())
+    elif _INITIALS1_RE.match(AGN):
+        return ' '.join(_INITIALS1_RE.findall(AGN))
+    return AGN
+
 # PURPOSE: formats an input bibtex file
 def format_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
     # get reference filepath and reference format from referencerc file
     referencerc = reference_toolkit.get_data_path(['assets','.referencerc'])
     datapath, dataformat = reference_toolkit.read_referencerc(referencerc)
-    # valid bibtex entry types
-    bibtex_entry_types = ['article','book','booklet','conference','inbook',
-        'incollection','inproceedings','manual','mastersthesis','phdthesis',
-        'proceedings','techreport','unpublished','webpage']
-    entry_regex = r'[?<=\@](' + '|'.join(bibtex_entry_types) + r')[\s]?\{(.*?)[\s]?,[\s]?'
-    R1 = re.compile(entry_regex, flags=re.IGNORECASE)
-    # bibtex fields to be printed in the output file
-    bibtex_field_types = ['address','affiliation','annote','author','booktitle',
-        'chapter','crossref','doi','edition','editor','howpublished','institution',
-        'isbn','issn','journal','key','keywords','month','note','number','organization',
-        'pages','publisher','school','series','title','type','url','volume','year']
-    field_regex = r'[\s]?(' + r'|'.join(bibtex_field_types) + \
-        r')[\s]?\=[\s]?[\"|\']?[\{]?[\{]?[\s]?(.*?)[\s+]?[\}]?[\}]?[\"|\']?[\s]?[\,]?[\s]?\n'
-    R2 = re.compile(field_regex, flags=re.IGNORECASE)
-    # sort bibtex fields in output files
-    bibtex_field_sort = {'address':15,'affiliation':16,'annote':25,'author':0,
-        'booktitle':12,'chapter':13,'crossref':27,'doi':10,'edition':19,'editor':21,
-        'howpublished':22,'institution':17,'isbn':8,'issn':7,'journal':2,'key':24,
-        'keywords':28,'month':4,'note':23,'number':6,'organization':17,'pages':11,
-        'publisher':14,'school':18,'series':20,'title':1,'type':26,'url':9,
-        'volume':5,'year':3}
-    # regular expression pattern to extract doi from webpages or "doi:"
-    doi_regex = r'(doi\:[\s]?|http[s]?\:\/\/(dx\.)?doi\.org\/)?(10\.(.*?))$'
-    R3 = re.compile(doi_regex, flags=re.IGNORECASE)
-
-    # list of known compound surnames to search for
-    compound_surname_regex = []
-    compound_surname_regex.append(r'(?<=\s)van\s[de|den]?[\s]?(.*?)')
-    compound_surname_regex.append(r'(?<=\s)von\s[de|den]?[\s]?(.*?)')
-    compound_surname_regex.append(r'(?<![van|von])(?<=\s)de\s(.*?)')
-    compound_surname_regex.append(r'(?<!de)(?<=\s)(la|los)\s?(.*?)')
 
     # create python dictionary with entry
     bibtex_entry = {}
     bibtex_key = {}
-    # extract bibtex entry type and bibtex cite key
-    bibtype,bibkey = R1.findall(file_contents).pop()
-    bibtex_key['entrytype'] = bibtype.lower()
-    bibtex_key['citekey'] = bibkey
-    bibtex_field_entries = R2.findall(file_contents)
     bibtex_keywords = []
-    for key,val in bibtex_field_entries:
-        if (key.lower() == 'title'):
+    for match in _BIBTEX_RE.finditer(file_contents):
+        # extract bibtex entry type and bibtex cite key
+        if match.group('entrytype'):
+            bibtex_key['entrytype'] = match.group('entrytype').lower()
+            bibtex_key['citekey'] = match.group('citekey')
+            continue
+        # extract bibtex field entries
+        key,val = match.group('field','value')
+        key = key.lower()
+        if (key == 'title'):
             # format titles in double curly brackets
-            bibtex_entry[key.lower()] = '{{{0}}}'.format(val)
-        elif (key.lower() in ('author','editor')) and (',' not in val):
+            bibtex_entry[key] = '{{{0}}}'.format(val)
+        elif (key in ('author','editor')) and (',' not in val):
             # format authors in surname, given name(s)
             current_authors = []
-            for A in re.split(' and ', val, flags=re.IGNORECASE):
+            for A in _AUTHORS_RE.split(val):
                 # flip given name(s) and lastname
-                i = None; j = 0
+                i = None
                 # check if lastname is in list of known compound surnames
-                while (i is None) and (j < len(compound_surname_regex)):
-                    R = re.compile(compound_surname_regex[j],flags=re.IGNORECASE)
-                    i = R.search(A).start() if R.search(A) else None
-                    j += 1
+                for R in _COMPOUND_SURNAME_RE:
+                    m = R.search(A)
+                    if m:
+                        i = m.start()
+                        break
                 # if the lastname was compound
                 if i is not None:
                     ALN,AGN = A[i:],A[:i].rstrip()
@@ -115,44 +188,37 @@ def format_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
                     ALN = author_fields[-1]
                     AGN = ' '.join(author_fields[:-1])
                 # split initials if as a single variable
-                if re.match(r'([A-Z])\.([A-Z])\.', AGN):
-                    AGN=' '.join(re.findall(r'([A-Z])\.([A-Z])\.',AGN).pop())
-                elif re.match(r'([A-Za-z]+)\s([A-Z])\.', AGN):
-                    AGN=' '.join(re.findall(r'([A-Za-z]+)\s([A-Z])\.',AGN).pop())
-                elif re.match(r'([A-Z])\.', AGN):
-                    AGN=' '.join(re.findall(r'([A-Z])\.',AGN))
+                AGN = _split_initials(AGN)
                 # add to current authors list
                 current_authors.append('{0}, {1}'.format(ALN,AGN))
             # merge authors list
-            bibtex_entry[key.lower()] = ' and '.join(current_authors)
-        elif (key.lower() in ('author','editor')):
+            bibtex_entry[key] = ' and '.join(current_authors)
+        elif (key in ('author','editor')):
             current_authors = []
-            for A in re.split(' and ', val, flags=re.IGNORECASE):
+            for A in _AUTHORS_RE.split(val):
                 ALN,AGN = A.split(', ')
                 # split initials if as a single variable
-                if re.match(r'([A-Z])\.([A-Z])\.', AGN):
-                    AGN=' '.join(re.findall(r'([A-Z])\.([A-Z])\.',AGN).pop())
-                elif re.match(r'([A-Za-z]+)\s([A-Z])\.', AGN):
-                    AGN=' '.join(re.findall(r'([A-Za-z]+)\s([A-Z])\.',AGN).pop())
-                elif re.match(r'([A-Z])\.', AGN):
-                    AGN=' '.join(re.findall(r'([A-Z])\.',AGN))
+                AGN = _split_initials(AGN)
                 # add to current authors list
                 current_authors.append('{0}, {1}'.format(ALN,AGN))
             # merge authors list
-            bibtex_entry[key.lower()] = ' and '.join(current_authors)
-        elif (key.lower() == 'doi') and bool(R3.match(val)):
-            bibtex_entry[key.lower()] = R3.match(val).group(3)
-        elif (key.lower() == 'pages') and re.match(r'(.*?)\s\-\s(.*?)$',val):
-            pages, = re.findall(r'(.*?)\s\-\s(.*?)$',val)
-            bibtex_entry[key.lower()] = '{0}--{1}'.format(pages[0],pages[1])
-        elif (key.lower() == 'keywords'):
+            bibtex_entry[key] = ' and '.join(current_authors)
+        elif (key == 'doi') and _DOI_RE.match(val):
+            bibtex_entry[key] = _DOI_RE.match(val).group(3)
+        elif (key == 'pages') and _PAGES_RE.match(val):
+            pages = _PAGES_RE.match(val).groups()
+            bibtex_entry[key] = '{0}--{1}'.format(pages[0],pages[1])
+        elif (key == 'keywords'):
             bibtex_keywords.append(val)
         else:
-            bibtex_entry[key.lower()] = val
+            bibtex_entry[key] = val
 
     # if author fields are initially completely uppercase: change to title()
     if bibtex_entry['author'].isupper():
         bibtex_entry['author'] = bibtex_entry['author'].title()
+    # compose decomposed unicode characters to match the conversion tables
+    bibtex_entry['author'] = unicodedata.normalize('NFC', bibtex_entry['author'])
+    bibtex_entry['title'] = unicodedata.normalize('NFC', bibtex_entry['title'])
     # extract surname of first author
     firstauthor = bibtex_entry['author'].split(',')[0]
     author_directory = bibtex_entry['author'].split(',')[0]
@@ -161,65 +227,67 @@ def format_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
     # author_directory: replace unicode characters with combined unicode
     # bibtex entry for authors: replace unicode characters with latex symbols
     # bibtex entry for titles: replace unicode characters with latex symbols
-    # 1st column: latex, 2nd: combining unicode, 3rd: unicode, 4th: plain text
-    for LV, CV, UV, PV in reference_toolkit.language_conversion():
-        firstauthor = firstauthor.replace(LV, PV).replace(UV, PV)
-        author_directory = author_directory.replace(LV, CV).replace(UV, CV)
-        bibtex_entry['author'] = bibtex_entry['author'].replace(UV, LV)
-        bibtex_entry['title'] = bibtex_entry['title'].replace(UV, LV)
-    # encode as utf-8
-    firstauthor = firstauthor.encode('utf-8')
+    firstauthor = _replace_latex(firstauthor, _LATEX_PLAIN_RE,
+        reference_toolkit.LATEX_TO_PLAIN)
+    author_directory = _replace_latex(author_directory, _LATEX_COMBINING_RE,
+        reference_toolkit.LATEX_TO_COMBINING)
+    firstauthor = firstauthor.translate(reference_toolkit.UNICODE_TO_PLAIN)
+    author_directory = author_directory.translate(reference_toolkit.AUTHOR_NFD_TABLE)
+    bibtex_entry['author'] = bibtex_entry['author'].translate(
+        reference_toolkit.UNICODE_TO_LATEX)
+    bibtex_entry['title'] = bibtex_entry['title'].translate(
+        reference_toolkit.UNICODE_TO_LATEX)
     # remove line skips and series of whitespace from title
-    bibtex_entry['title'] = re.sub(r'\s+',' ',bibtex_entry['title'])
+    bibtex_entry['title'] = _WHITESPACE_RE.sub(' ',bibtex_entry['title'])
     # remove spaces, dashes and apostrophes from author_directory
-    author_directory = re.sub(r'\s','_',author_directory)
-    author_directory = re.sub(r'\-|\'','',author_directory)
-    year_directory, = re.findall(r'\d+',bibtex_entry['year'])
+    author_directory = _SPACE_RE.sub('_',author_directory)
+    author_directory = _DASH_APOSTROPHE_RE.sub('',author_directory)
+    year_directory, = _YEAR_RE.findall(bibtex_entry['year'])
 
     # create list of article keywords if present in bibliography file
     if bibtex_keywords:
         bibtex_entry['keywords'] = ', '.join(bibtex_keywords)
 
     # extract DOI and title for generating universal citekeys
-    doi = bibtex_entry['doi'] if 'doi' in bibtex_entry.keys() else None
-    title = bibtex_entry['title'] if 'title' in bibtex_entry.keys() else None
+    doi = bibtex_entry.get('doi')
+    title = bibtex_entry.get('title')
     # calculate the universal citekey
-    univ_key = reference_toolkit.gen_citekey(firstauthor.decode('utf-8'),
+    univ_key = reference_toolkit.gen_citekey(firstauthor,
         bibtex_entry['year'], doi, title)
 
-    # if printing to file: output bibtex file for author and year
-    if OUTPUT:
-        # parse universal citekey to generate output filename
-        authkey,citekey,=re.findall(r'(\D+)\:(\d+\D+)',univ_key).pop()
-        # output directory
-        bibtex_dir = datapath.joinpath(year_directory,author_directory)
-        bibtex_dir.mkdir(parents=True, exist_ok=True)
-        # create file object for output file
-        bibtex_file = bibtex_dir.joinpath(f'{authkey}-{citekey}.bib')
-        fid = bibtex_file.open(mode='w', encoding='utf-8')
-        print(f'  --> {str(compressuser(bibtex_file))}') if VERBOSE else None
-    else:
-        fid = sys.stdout
-
-    # print the bibtex citation
-    print('@{0}{{{1},'.format(bibtex_key['entrytype'],univ_key),file=fid)
+    # build the bibtex citation
+    lines = ['@{0}{{{1},'.format(bibtex_key['entrytype'],univ_key)]
     # sort output bibtex files as listed above
-    field_indices = [bibtex_field_sort[b] for b in bibtex_entry.keys()]
-    field_tuple = zip(field_indices,bibtex_entry.keys(),bibtex_entry.values())
+    field_slots = [None]*len(_FIELD_SLOTS)
+    for k,v in bibtex_entry.items():
+        field_slots[_FIELD_SLOTS[k]] = (k,v)
     # for each field within the entry
-    for s,k,v in sorted(field_tuple):
+    for k,v in filter(None, field_slots):
         # make sure ampersands are in latex format (marked with symbol)
-        v = re.sub(r'(?<=\s)\&',r'\\\&',v) if re.search(r'(?<=\s)\&',v) else v
+        v = _AMPERSAND_RE.sub(r'\\&',v)
         # do not put the month field in brackets
         if (k == 'month'):
-            print('{0} = {1},'.format(k,v.lower()),file=fid)
+            lines.append('{0} = {1},'.format(k,v.lower()))
         else:
-            print('{0} = {{{1}}},'.format(k,v),file=fid)
-    print('}', file=fid)
+            lines.append('{0} = {{{1}}},'.format(k,v))
+    lines.append('}')
+    bibtex = '\n'.join(lines)
 
-    # close the output file
+    # if printing to file: output bibtex file for author and year
     if OUTPUT:
-        fid.close()
+        # parse universal citekey to generate output filename
+        authkey,citekey,=_CITEKEY_RE.findall(univ_key).pop()
+        # output directory
+        bibtex_dir = datapath.joinpath(year_directory,author_directory)
+        bibtex_dir.mkdir(parents=True, exist_ok=True)
+        # print the bibtex citation to the output file
+        bibtex_file = bibtex_dir.joinpath(f'{authkey}-{citekey}.bib')
+        with bibtex_file.open(mode='w', encoding='utf-8') as fid:
+            print(bibtex, file=fid)
+        # return the output filename for verbose output
+        return f'  --> {str(compressuser(bibtex_file))}' if VERBOSE else None
+    # return the bibtex citation for printing to the terminal
+    return bibtex
 
 def compressuser(filename):
     """
@@ -238,6 +306,23 @@ def compressuser(filename):
     else:
         return pathlib.Path('~').joinpath(relative_to)
 
+# PURPOSE: read and format a single input bibtex file
+def _format_file(FILE, OUTPUT=False, CLEANUP=False, VERBOSE=False):
+    # text to print to the terminal for the input file
+    output = [str(compressuser(FILE))] if VERBOSE else []
+    with FILE.open(mode='r', encoding='utf-8') as f:
+        file_contents = f.read()
+    try:
+        bibtex = format_bibtex(_TRAILING_WHITESPACE_RE.sub('\n',file_contents),
+            OUTPUT=OUTPUT, VERBOSE=VERBOSE)
+    except:
+        pass
+    else:
+        output.append(bibtex) if bibtex else None
+        # remove the input file
+        FILE.unlink() if CLEANUP else None
+    return '\n'.join(output)
+
 # main program that calls format_bibtex()
 def main():
     # Read the system arguments listed after the program
@@ -261,20 +346,19 @@ def main():
         help='Verbose output of input and output files')
     args = parser.parse_args()
 
-    # for each file entered
-    for FILE in args.infile:
-        # run for the input file
-        print(str(compressuser(FILE))) if args.verbose else None
-        with FILE.open(mode='r', encoding='utf-8') as f:
-            file_contents = f.read()
-        try:
-            format_bibtex(re.sub('(\s+)\n','\n',file_contents),
-                OUTPUT=args.output, VERBOSE=args.verbose)
-        except:
-            pass
-        else:
-            # remove the input file
-            FILE.unlink() if args.cleanup else None
+    # format each file entered
+    kwargs = dict(OUTPUT=args.output, CLEANUP=args.cleanup,
+        VERBOSE=args.verbose)
+    if (len(args.infile) == 1):
+        output = _format_file(args.infile[0], **kwargs)
+        print(output) if output else None
+        return
+    # format multiple files using a pool of processes
+    # and print the formatted text in the order of the input files
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        for output in executor.map(functools.partial(_format_file, **kwargs),
+                args.infile):
+            print(output) if output else None
 
 # run main program
 if __name__ == '__main__':
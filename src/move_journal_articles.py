@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-move_journal_articles.py (05/2023)
+move_journal_articles.py (10/2026)
 Moves journal articles and supplements to the reference local directory
 
 Enter Author names, journal name, publication year and volume will copy a pdf
@@ -13,7 +13,7 @@ CALLING SEQUENCE:
     will move the file to 2008/Rignot/Rignot_Nat._Geosci.-1_2008.pdf
 
 INPUTS:
-    file to be moved into the reference path
+    file(s) to be moved into the reference path
 
 COMMAND LINE OPTIONS:
     -A X, --author X: lead author of publication
@@ -35,6 +35,17 @@ NOTES:
         unicode characters with http://www.fileformat.info/
 
 UPDATE HISTORY:
+    Updated 10/2026: convert author names with a single cached translation table
+        parse abbreviations into a dictionary for journal name lookups
+        rename input file into place when cleaning up on the same file system
+        copy input files with shutil.copyfile to use platform fast-copy
+        use prebuilt translation table for converting author names
+        create argument parser in separate function
+        can move multiple files with publication information for each
+        use shared reader for the journal abbreviations file
+        check input file before reserving the unique output filename
+        remove the reserved output file if copying the input fails
+        report failures for each file and continue with the remaining files
     Updated 05/2023: use pathlib to find and operate on paths
     Updated 09/2022: drop python2 compatibility
     Updated 12/2020: using argparse to set command line options
@@ -45,8 +56,9 @@ UPDATE HISTORY:
 """
 from __future__ import print_function
 
+import os
 import sys
-import re
+import errno
 import shutil
 import pathlib
 import argparse
@@ -64,24 +76,17 @@ def move_journal_articles(fi,author,journal,year,volume,number,SUPPLEMENT,CLEANU
     # https://github.com/JabRef/abbrv.jabref.org/tree/master/journals
     abbreviation_file = reference_toolkit.get_data_path(['assets',
         'journal_abbreviations_webofscience-ts.txt'])
-    # create regular expression pattern for extracting abbreviations
-    arg = journal.replace(' ',r'\s+')
-    rx = re.compile(rf'\n{arg}[\s+]?\=[\s+]?(.*?)\n', flags=re.IGNORECASE)
     # try to find journal article within filename from webofscience file
-    with abbreviation_file.open(mode="r", encoding="utf8") as f:
-        abbreviation_contents = f.read()
-
+    key = ' '.join(journal.split()).lower()
+    abbreviation = reference_toolkit.read_journal_abbreviations(
+        abbreviation_file).get(key)
     # if abbreviation not found: just use the whole journal name
-    # else use the found journal abbreviation
-    if not bool(rx.search(abbreviation_contents)):
+    if abbreviation is None:
         print(f'Abbreviation for {journal} not found')
         abbreviation = journal
-    else:
-        abbreviation = rx.findall(abbreviation_contents)[0]
 
-    # 1st column: latex, 2nd: combining unicode, 3rd: unicode, 4th: plain text
-    for LV, CV, UV, PV in reference_toolkit.language_conversion():
-        author = author.replace(UV, CV)
+    # convert unicode characters in author to combining unicode
+    author = author.translate(reference_toolkit.AUTHOR_NFD_TABLE)
 
     # directory path for local file
     if SUPPLEMENT:
@@ -103,45 +108,89 @@ def move_journal_articles(fi,author,journal,year,volume,number,SUPPLEMENT,CLEANU
     args = (author, journal.replace(' ','_'), abbreviation.replace(' ','_'),
         volume, number, year, fileExtension)
     local_file = directory.joinpath(dataformat.format(*args))
-    # open input file and copy contents to local file
-    with open(fi, 'rb') as f_in, \
-        reference_toolkit.create_unique_filename(local_file) as f_out:
-            shutil.copyfileobj(f_in, f_out)
+    # check that the input file exists before reserving the local file
+    fi.stat()
+    # reserve a unique filename for the local file
+    with reference_toolkit.create_unique_filename(local_file,
+        VERBOSE=False) as f_out:
+        unique_file = f_out.name
+    # if removing the input file: try renaming into the unique filename
+    if CLEANUP:
+        try:
+            os.replace(fi, unique_file)
+        except OSError as exc:
+            # copy if the files are on different file systems
+            if (exc.errno != errno.EXDEV):
+                # remove the reserved file if the input could not be moved
+                os.unlink(unique_file)
+                raise
+        else:
+            print(str(reference_toolkit.compressuser(unique_file)))
+            return
+    # copy contents of input file to local file
+    try:
+        shutil.copyfile(fi, unique_file)
+    except Exception:
+        # remove the reserved file if the input could not be copied
+        os.unlink(unique_file)
+        raise
+    print(str(reference_toolkit.compressuser(unique_file)))
     # remove the input file
     fi.unlink() if CLEANUP else None
 
-# main program that calls move_journal_articles()
-def main():
-    # Read the system arguments listed after the program
+# PURPOSE: create argument parser
+def arguments():
     parser = argparse.ArgumentParser(
         description="""Moves a journal article to the reference local directory
             """
     )
     # command line parameters
     parser.add_argument('infile',
-        type=pathlib.Path,
+        type=pathlib.Path, nargs='+',
         help='article file to be copied into the reference path')
     parser.add_argument('--author','-A',
-        type=str, help='Lead author of publication')
+        type=str, action='append', help='Lead author of publication')
     parser.add_argument('--journal','-J',
-        type=str, help='Corresponding publication journal')
+        type=str, action='append', help='Corresponding publication journal')
     parser.add_argument('--year','-Y',
-        type=str, help='Corresponding publication year')
+        type=str, action='append', help='Corresponding publication year')
     parser.add_argument('--volume','-V',
-        type=str, default='', help='Corresponding publication volume')
+        type=str, action='append', help='Corresponding publication volume')
     parser.add_argument('--number','-N',
-        type=str, default='', help='Corresponding publication number')
+        type=str, action='append', help='Corresponding publication number')
     parser.add_argument('--supplement','-S',
         default=False, action='store_true',
         help='File is an article supplement')
     parser.add_argument('--cleanup','-C',
         default=False, action='store_true',
         help='Remove input file after moving')
+    # return the parser
+    return parser
+
+# main program that calls move_journal_articles()
+def main():
+    # Read the system arguments listed after the program
+    parser = arguments()
     args = parser.parse_args()
 
-    # move article file to reference directory
-    move_journal_articles(args.infile, args.author, args.journal, args.year,
-        args.volume, args.number, args.supplement, args.cleanup)
+    # use publication information for all files if only listed once
+    defaults = dict(author=None, journal=None, year=None, volume='', number='')
+    for key, default in defaults.items():
+        values = getattr(args, key) or [default]
+        if (len(values) == 1):
+            setattr(args, key, values*len(args.infile))
+        elif (len(values) != len(args.infile)):
+            parser.error(f'--{key} must be listed once or for each file')
+
+    # move each article file to reference directory
+    for fi, A, J, Y, V, N in zip(args.infile, args.author, args.journal,
+        args.year, args.volume, args.number):
+        # report any failed files and continue with the remaining files
+        try:
+            move_journal_articles(fi, A, J, Y, V, N,
+                args.supplement, args.cleanup)
+        except Exception as exc:
+            print(f'Failed to move {fi}: {exc}')
 
 # run main program
 if __name__ == '__main__':
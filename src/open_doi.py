@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-open_doi.py (12/2020)
+open_doi.py (10/2026)
 Opens the webpages and crossref.org API webpages associated with a Digital
     Object Identifier (DOI)
 
@@ -12,33 +12,65 @@ COMMAND LINE OPTIONS:
     -V, --verbose: Verbose output of webpages opened
 
 UPDATE HISTORY:
+    Updated 10/2026: open all webpages in a single browser launch if possible
+        build webpage urls with f-strings and percent-encoded DOI segments
+        drop python2 compatibility
+        print webpages if a runnable browser cannot be found
     Updated 12/2020: using argparse to set command line options
     Written 10/2017
 """
-from __future__ import print_function
-import future.standard_library
-
 import argparse
-import posixpath
+import subprocess
 import webbrowser
-with future.standard_library.hooks():
-    import urllib.parse
+import urllib.parse
+
+# PURPOSE: webpage associated with a Digital Object Identifier (DOI)
+def doiurl(DOI):
+    return f'https://doi.org/{DOI}'
+
+# PURPOSE: crossref.org API webpage associated with a DOI
+def crossrefurl(DOI):
+    return f'https://api.crossref.org/works/{urllib.parse.quote(DOI, safe="")}'
 
 # PURPOSE: open webpage associated with a Digital Object Identifier (DOI)
 def doiopen(DOI, VERBOSE=False):
     # Open URL for DOI in a new tab, if browser window is already open
-    URL = posixpath.join('https://doi.org',DOI)
+    URL = doiurl(DOI)
     print(URL) if VERBOSE else None
     webbrowser.open_new_tab(URL)
 
 # PURPOSE: open crossref.org API associated with a DOI
 def crossrefopen(DOI, VERBOSE=False):
     # Open URL for DOI in a new tab, if browser window is already open
-    URL = posixpath.join('https://api.crossref.org','works',
-        urllib.parse.quote_plus(DOI))
+    URL = crossrefurl(DOI)
     print(URL) if VERBOSE else None
     webbrowser.open_new_tab(URL)
 
+# PURPOSE: open a list of webpages in new tabs
+def tabsopen(URLS, VERBOSE=False):
+    # print the webpages to be opened
+    if VERBOSE:
+        for URL in URLS:
+            print(URL)
+    # find the browser controller once for all webpages
+    try:
+        browser = webbrowser.get()
+    except webbrowser.Error as exc:
+        # print the webpages to open manually if no browser is available
+        print(f'Could not find a runnable browser: {exc}')
+        if not VERBOSE:
+            for URL in URLS:
+                print(URL)
+        return
+    # Firefox and Chrome can open all webpages with a single command
+    if isinstance(browser, (webbrowser.Mozilla, webbrowser.Chrome)):
+        subprocess.Popen([browser.name, *URLS],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        # Open each URL in a new tab, if browser window is already open
+        for URL in URLS:
+            browser.open_new_tab(URL)
+
 # main program that calls doiopen() and crossrefopen()
 def main():
     # Read the system arguments listed after the program
@@ -59,10 +91,13 @@ def main():
         help='Verbose output of webpages opened')
     args = parser.parse_args()
 
-    # run for each DOI entered after the program
+    # webpages for each DOI entered after the program
+    URLS = []
     for DOI in args.doi:
-        doiopen(DOI, VERBOSE=args.verbose)
-        crossrefopen(DOI, VERBOSE=args.verbose) if args.crossref else None
+        URLS.append(doiurl(DOI))
+        URLS.append(crossrefurl(DOI)) if args.crossref else None
+    # open all webpages
+    tabsopen(URLS, VERBOSE=args.verbose)
 
 # run main program
 if __name__ == '__main__':
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-ris_to_bibtex.py (05/2023)
+ris_to_bibtex.py (10/2026)
 Converts RIS bibliography files into bibtex files with Universal citekeys
     https://en.wikipedia.org/wiki/RIS_(file_format)
 
@@ -22,6 +22,16 @@ NOTES:
         https://github.com/cparnot/universal-citekey-js
 
 UPDATE HISTORY:
+    Updated 10/2026: pass the first author as a string to gen_citekey
+        match each RIS line once and read the field and value from the match
+        compile regular expressions once at module scope
+        search compound surnames with a for loop over compiled patterns
+        convert unicode characters with single str.translate passes
+        stream lines from the input RIS files rather than reading all lines
+        build the output bibtex citation and write it with a single print
+        scan page and DOI fields with a single regular expression call
+        define field mappings and RIS and DOI patterns at module scope
+        open input RIS files outside of the conversion error handling
     Updated 05/2023: use pathlib to find and operate on paths
     Updated 09/2022: drop python2 compatibility
     Updated 12/2020: using argparse to set command line options
@@ -47,41 +57,59 @@ import argparse
 import datetime
 import reference_toolkit
 
+# easily mappable RIS and bibtex fields
+bibtex_field_map = {'JO':'journal','T2':'journal','VL':'volume',
+    'IS':'number','PB':'publisher','SN':'issn','UR':'url'}
+# map between RIS TY entries and bibtex entries
+bibtex_entry_map = {'JOUR':'article','EJOU':'article','BOOK':'book',
+    'CHAP':'inbook','CONF':'proceedings','RPRT':'techreport',
+    'THES':'phdthesis'}
+# fields of interest for parsing an RIS file
+RIS_fields = ['TY','AU','A1','A2','ED','TI','T1','T2','JA','JO','PY','Y1',
+    'VL','IS','SP','EP','LP','PB','SN','UR','L3','M3','ER','DO','DOI','N1',
+    'KW','AB','KW']
+# regular expression for reading RIS files
+RIS_regex = r'({0})\s+\-\s+(.*?)[\s]?$'.format('|'.join(RIS_fields))
+_RIS_RE = re.compile(RIS_regex, flags=re.IGNORECASE)
+# regular expression pattern to extract doi from webpages or "doi:"
+doi_regex = r'(doi\:[\s]?|http[s]?\:\/\/(dx\.)?doi\.org\/)?(10\.(.*?))$'
+_DOI_RE = re.compile(doi_regex, flags=re.IGNORECASE)
+# sort bibtex fields in output
+bibtex_field_sort = {'address':15,'affiliation':16,'annote':25,'author':0,
+    'booktitle':12,'chapter':13,'crossref':27,'doi':10,'edition':19,'editor':21,
+    'howpublished':22,'institution':17,'isbn':8,'issn':7,'journal':2,'key':24,
+    'keywords':28,'month':4,'note':23,'number':6,'organization':17,'pages':11,
+    'publisher':14,'school':18,'series':20,'title':1,'type':26,'url':9,
+    'volume':5,'year':3}
+
+# list of known compound surnames to search for
+compound_surname_regex = []
+compound_surname_regex.append(r'(?<=\s)van\s[de|den]?[\s]?(.*?)')
+compound_surname_regex.append(r'(?<=\s)von\s[de|den]?[\s]?(.*?)')
+compound_surname_regex.append(r'(?<![van|von])(?<=\s)de\s(.*?)')
+compound_surname_regex.append(r'(?<!de)(?<=\s)(la|los)\s?(.*?)')
+_COMPOUND_SURNAME_RE = [re.compile(regex, flags=re.IGNORECASE)
+    for regex in compound_surname_regex]
+
+# regular expressions for author names and separating initials
+_FAMILY_GIVEN_RE = re.compile(r'(.*?),\s(.*?)')
+_INITIALS2_RE = re.compile(r'([A-Z])\.([A-Z])\.')
+_INITIALS_MIXED_RE = re.compile(r'([A-Za-z]+)\s([A-Z])\.')
+_INITIALS1_RE = re.compile(r'([A-Z])\.')
+# regular expression for parsing dates, pages and years
+_DIGITS_RE = re.compile(r'\d+')
+# regular expressions for scrubbing whitespace and symbols
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPACE_RE = re.compile(r'\s')
+_DASH_APOSTROPHE_RE = re.compile(r'\-|\'')
+_AMPERSAND_RE = re.compile(r'(?<=\s)\&')
+# regular expression for parsing universal citekeys
+_CITEKEY_RE = re.compile(r'(\D+)\:(\d+\D+)')
+
 def ris_to_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
     # get reference filepath and reference format from referencerc file
     referencerc = reference_toolkit.get_data_path(['assets','.referencerc'])
     datapath, dataformat = reference_toolkit.read_referencerc(referencerc)
-    # easily mappable RIS and bibtex fields
-    bibtex_field_map = {'JO':'journal','T2':'journal','VL':'volume',
-        'IS':'number','PB':'publisher','SN':'issn','UR':'url'}
-    # map between RIS TY entries and bibtex entries
-    bibtex_entry_map = {'JOUR':'article','EJOU':'article','BOOK':'book',
-        'CHAP':'inbook','CONF':'proceedings','RPRT':'techreport',
-        'THES':'phdthesis'}
-    # fields of interest for parsing an RIS file
-    RIS_fields = ['TY','AU','A1','A2','ED','TI','T1','T2','JA','JO','PY','Y1',
-        'VL','IS','SP','EP','LP','PB','SN','UR','L3','M3','ER','DO','DOI','N1',
-        'KW','AB','KW']
-    # regular expression for reading RIS files
-    RIS_regex = r'({0})\s+\-\s+(.*?)[\s]?$'.format('|'.join(RIS_fields))
-    R1 = re.compile(RIS_regex, flags=re.IGNORECASE)
-    # regular expression pattern to extract doi from webpages or "doi:"
-    doi_regex = r'(doi\:[\s]?|http[s]?\:\/\/(dx\.)?doi\.org\/)?(10\.(.*?))$'
-    R2 = re.compile(doi_regex, flags=re.IGNORECASE)
-    # sort bibtex fields in output
-    bibtex_field_sort = {'address':15,'affiliation':16,'annote':25,'author':0,
-        'booktitle':12,'chapter':13,'crossref':27,'doi':10,'edition':19,'editor':21,
-        'howpublished':22,'institution':17,'isbn':8,'issn':7,'journal':2,'key':24,
-        'keywords':28,'month':4,'note':23,'number':6,'organization':17,'pages':11,
-        'publisher':14,'school':18,'series':20,'title':1,'type':26,'url':9,
-        'volume':5,'year':3}
-
-    # list of known compound surnames to search for
-    compound_surname_regex = []
-    compound_surname_regex.append(r'(?<=\s)van\s[de|den]?[\s]?(.*?)')
-    compound_surname_regex.append(r'(?<=\s)von\s[de|den]?[\s]?(.*?)')
-    compound_surname_regex.append(r'(?<![van|von])(?<=\s)de\s(.*?)')
-    compound_surname_regex.append(r'(?<!de)(?<=\s)(la|los)\s?(.*?)')
 
     # create python dictionaries with entries and citekey
     current_entry = {}
@@ -94,9 +122,17 @@ def ris_to_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
     current_keywords = []
     current_pages = [None,None]
     # read each line to create bibtex entry
-    RIS_field_entries = [i for i in file_contents if R1.match(i)]
-    for line in RIS_field_entries:
-        RIS_field,RIS_value = R1.findall(line).pop()
+    for line in file_contents:
+        # skip lines that are not RIS fields of interest
+        m = _RIS_RE.match(line)
+        if not m:
+            continue
+        RIS_field,RIS_value = (m.group(1).upper(), m.group(2))
+        # find numbers in page fields and DOIs in link and note fields
+        digits = _DIGITS_RE.findall(RIS_value) \
+            if RIS_field in ('SP','EP','LP') else None
+        doi = _DOI_RE.search(RIS_value) \
+            if RIS_field in ('L3','DO','N1','M3','DOI') else None
         # check if easily mappable field
         if RIS_field in bibtex_field_map.keys():
             # associated bibtex key
@@ -112,7 +148,7 @@ def ris_to_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
             # check if author fields are initially uppercase: change to title
             RIS_value = RIS_value.title() if RIS_value.isupper() else RIS_value
             # output formatted author field = lastname, given name(s)
-            if re.match(r'(.*?),\s(.*?)',RIS_value):
+            if _FAMILY_GIVEN_RE.match(RIS_value):
                 # add to authors list
                 if RIS_field in ('ED'):
                     current_editors.append(RIS_value)
@@ -120,12 +156,13 @@ def ris_to_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
                     current_authors.append(RIS_value)
             else:
                 # flip given name(s) and lastname
-                i = None; j = 0
+                i = None
                 # check if lastname is in list of known compound surnames
-                while (i is None) and (j < len(compound_surname_regex)):
-                    R=re.compile(compound_surname_regex[j],flags=re.IGNORECASE)
-                    i=R.search(RIS_value).start() if R.search(RIS_value) else None
-                    j += 1
+                for R in _COMPOUND_SURNAME_RE:
+                    m = R.search(RIS_value)
+                    if m:
+                        i = m.start()
+                        break
                 # if the lastname was compound
                 if i is not None:
                     ALN,AGN = RIS_value[i:],RIS_value[:i].rstrip()
@@ -135,12 +172,12 @@ def ris_to_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
                     ALN = author_fields[-1]
                     AGN = ' '.join(author_fields[:-1])
                 # split initials if as a single variable
-                if re.match(r'([A-Z])\.([A-Z])\.', AGN):
-                    AGN=' '.join(re.findall(r'([A-Z])\.([A-Z])\.',AGN).pop())
-                elif re.match(r'([A-Za-z]+)\s([A-Z])\.', AGN):
-                    AGN=' '.join(re.findall(r'([A-Za-z]+)\s([A-Z])\.',AGN).pop())
-                elif re.match(r'([A-Z])\.', AGN):
-                    AGN=' '.join(re.findall(r'([A-Z])\.',AGN))
+                if _INITIALS2_RE.match(AGN):
+                    AGN=' '.join(_INITIALS2_RE.findall(AGN).pop())
+                elif _INITIALS_MIXED_RE.match(AGN):
+                    AGN=' '.join(_INITIALS_MIXED_RE.findall(AGN).pop())
+                elif _INITIALS1_RE.match(AGN):
+                    AGN=' '.join(_INITIALS1_RE.findall(AGN))
                 # add to current authors or editors list
                 if RIS_field in ('ED'):
                     current_editors.append('{0}, {1}'.format(ALN,AGN))
@@ -148,7 +185,7 @@ def ris_to_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
                     current_authors.append('{0}, {1}'.format(ALN,AGN))
         elif RIS_field in ('PY','Y1'):
             # partition between publication date to YY/MM/DD
-            cal_date = [int(d) for d in re.findall(r'\d+',RIS_value)]
+            cal_date = [int(d) for d in _DIGITS_RE.findall(RIS_value)]
             # year = first entry
             current_entry['year'] = '{0:4d}'.format(cal_date[0])
             # months of the year
@@ -156,18 +193,18 @@ def ris_to_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
                 # month = second entry
                 dt=datetime.datetime.strptime('{0:02d}'.format(cal_date[1]),'%m')
                 current_entry['month'] = dt.strftime('%b').lower()
-        elif (RIS_field == 'SP') and bool(re.search(r'\d+',RIS_value)):
+        elif (RIS_field == 'SP') and digits:
             # add starting page to current_pages array
-            pages = [int(p) for p in re.findall(r'\d+',RIS_value)]
+            pages = [int(p) for p in digits]
             current_pages[0] = pages[0]
             if (len(pages) > 1):
                 current_pages[1] = pages[1]
-        elif RIS_field in ('EP','LP') and bool(re.search(r'\d+',RIS_value)):
+        elif RIS_field in ('EP','LP') and digits:
             # add ending page to current_pages array
             current_pages[1] = RIS_value
-        elif RIS_field in ('L3','DO','N1','M3','DOI') and bool(R2.search(RIS_value)):
+        elif doi:
             # extract DOI
-            current_entry['doi'] = R2.search(RIS_value).group(3)
+            current_entry['doi'] = doi.group(3)
         elif (RIS_field == 'KW'):
             # add to keywords list
             current_keywords.append(RIS_value)
@@ -184,31 +221,29 @@ def ris_to_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
         current_entry['editor'] = ' and '.join(current_editors)
 
     # firstauthor: replace unicode characters with plain text
+    # author_directory: replace unicode characters with combined unicode
     # bibtex entry for authors: replace unicode characters with latex symbols
-    # 1st column: latex, 2nd: combining unicode, 3rd: unicode, 4th: plain text
-    for LV, CV, UV, PV in reference_toolkit.language_conversion():
-        firstauthor = firstauthor.replace(UV, PV)
-        author_directory = author_directory.replace(UV, CV)
-        current_entry['author'] = current_entry['author'].replace(UV, LV)
-        current_entry['title'] = current_entry['title'].replace(UV, LV)
-        current_entry['journal'] = current_entry['journal'].replace(UV, LV)
-        if current_editors:
-            current_entry['editor'] = current_entry['editor'].replace(UV, LV)
-    # encode as utf-8
-    firstauthor = firstauthor.encode('utf-8')
+    firstauthor = firstauthor.translate(reference_toolkit.UNICODE_TO_PLAIN)
+    author_directory = author_directory.translate(
+        reference_toolkit.AUTHOR_NFD_TABLE)
+    latex_fields = ('author','title','journal','editor') if current_editors \
+        else ('author','title','journal')
+    for key in latex_fields:
+        current_entry[key] = current_entry[key].translate(
+            reference_toolkit.UNICODE_TO_LATEX)
     # remove line skips and series of whitespace from title
-    current_entry['title'] = re.sub(r'\s+',r' ',current_entry['title'])
+    current_entry['title'] = _WHITESPACE_RE.sub(r' ',current_entry['title'])
     # remove spaces, dashes and apostrophes from author_directory
-    author_directory = re.sub(r'\s',r'_',author_directory)
-    author_directory = re.sub(r'\-|\'',r'',author_directory)
-    year_directory, = re.findall(r'\d+',current_entry['year'])
+    author_directory = _SPACE_RE.sub(r'_',author_directory)
+    author_directory = _DASH_APOSTROPHE_RE.sub(r'',author_directory)
+    year_directory, = _DIGITS_RE.findall(current_entry['year'])
 
     # create list of article keywords if present in bibliography file
     if current_keywords:
         current_entry['keywords'] = ', '.join(current_keywords)
 
     # calculate the universal citekey
-    current_key['citekey'] = reference_toolkit.gen_citekey(firstauthor.decode('utf-8'),
+    current_key['citekey'] = reference_toolkit.gen_citekey(firstauthor,
         current_entry['year'], current_entry['doi'], current_entry['title'])
 
     # create entry for pages
@@ -222,7 +257,7 @@ def ris_to_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
     # if printing to file: output bibtex file for author and year
     if OUTPUT:
         # parse universal citekey to generate output filename
-        authkey,citekey,=re.findall(r'(\D+)\:(\d+\D+)',current_key['citekey']).pop()
+        authkey,citekey,=_CITEKEY_RE.findall(current_key['citekey']).pop()
         # output directory
         bibtex_dir = datapath.joinpath(year_directory,author_directory)
         bibtex_dir.mkdir(parents=True, exist_ok=True)
@@ -233,21 +268,23 @@ def ris_to_bibtex(file_contents, OUTPUT=False, VERBOSE=False):
     else:
         fid = sys.stdout
 
-    # print the bibtex citation
-    print('@{0}{{{1},'.format(current_key['entrytype'],current_key['citekey']),file=fid)
+    # build the bibtex citation
+    lines = ['@{0}{{{1},'.format(current_key['entrytype'],current_key['citekey'])]
     # sort output bibtex files as listed above
     field_indices = [bibtex_field_sort[b] for b in current_entry.keys()]
     field_tuple=zip(field_indices,current_entry.keys(),current_entry.values())
     # for each field within the entry
     for s,k,v in sorted(field_tuple):
         # make sure ampersands are in latex format
-        v = re.sub(r'(?<=\s)\&','\\\&',v) if re.search(r'(?<=\s)\&',v) else v
+        v = _AMPERSAND_RE.sub(r'\\&',v)
         # do not put the month field in brackets
         if (k == 'month'):
-            print('{0} = {1},'.format(k,v.rstrip()),file=fid)
+            lines.append('{0} = {1},'.format(k,v.rstrip()))
         else:
-            print('{0} = {{{1}}},'.format(k,v.rstrip()),file=fid)
-    print('}',file=fid)
+            lines.append('{0} = {{{1}}},'.format(k,v.rstrip()))
+    lines.append('}')
+    # print the bibtex citation
+    print('\n'.join(lines), file=fid)
 
     # close the output file
     if OUTPUT:
@@ -295,18 +332,19 @@ def main():
 
     # for each file entered
     for FILE in args.infile:
-        # run for the input file
+        # run for the lines of the input file
         with FILE.open(mode='r', encoding='utf-8') as f:
-            file_contents = f.readlines()
-        try:
-            ris_to_bibtex(file_contents,
-                OUTPUT=args.output,
-                VERBOSE=args.verbose)
-        except:
-            pass
-        else:
-            # remove the input file
-            FILE.unlink() if args.cleanup else None
+            try:
+                ris_to_bibtex(f,
+                    OUTPUT=args.output,
+                    VERBOSE=args.verbose)
+            except UnicodeDecodeError:
+                # raise errors from reading the input file
+                raise
+            except:
+                continue
+        # remove the input file
+        FILE.unlink() if args.cleanup else None
 
 
 # run main program
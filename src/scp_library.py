@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-scp_library.py (05/2023)
+scp_library.py (10/2026)
 Exports complete library into a remote directory via scp
 Will only copy new or overwritten files by checking the last modified dates
 
@@ -30,6 +30,7 @@ PROGRAM DEPENDENCIES:
     utilities.py: Sets default file path and file format for output files
 
 UPDATE HISTORY:
+    Updated 10/2026: check for supplementary directories with a single stat
     Updated 05/2023: use pathlib to find and operate on paths
     Updated 12/2020: using argparse to set command line options
     Written 02/2019
@@ -114,7 +115,7 @@ def scp_library(client, ftp, R, PULL=False, LIST=False,
                         MODE=MODE)
                 # if there is supplementary information
                 SI = A.joinpath(S)
-                if SI.exists() and SI.is_dir():
+                if SI.is_dir():
                     # find supplementary files within Supplemental directory
                     FILES = [f for f in SI.iterdir() if re.match(regex,f)]
                     # transfer each supplementary file (check if existing)
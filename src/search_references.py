@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-search_references.py (05/2023)
+search_references.py (10/2026)
 Reads bibtex files for each article in a given set of years to search for
     keywords, authors, journal, etc using regular expressions
 
@@ -24,6 +24,8 @@ PROGRAM DEPENDENCIES:
     language_conversion.py: mapping to convert symbols between languages
 
 UPDATE HISTORY:
+    Updated 10/2026: convert latex symbols with a single regular expression pass
+        skip latex symbols that convert to themselves when matching symbols
     Updated 05/2023: use pathlib to find and operate on paths
     Updated 09/2022: drop python2 compatibility
     Updated 12/2020: using argparse to set command line options
@@ -47,6 +49,12 @@ import subprocess
 import webbrowser
 import reference_toolkit
 
+# regular expression for matching latex symbols in a single pass
+# symbols that convert to themselves are skipped so that they do not
+# block longer symbols starting with the same characters (' and '')
+_LATEX_RE = re.compile(r'|'.join(re.escape(LV) for LV, CV in
+    reference_toolkit.LATEX_TO_COMBINING.items() if (LV != CV)))
+
 # Reads bibtex files for each article stored in the working directory for
 # keywords, authors, journal, etc
 def search_references(AUTHOR, JOURNAL, YEAR, KEYWORDS, DOI, FIRST=False,
@@ -103,9 +111,8 @@ def search_references(AUTHOR, JOURNAL, YEAR, KEYWORDS, DOI, FIRST=False,
                 entry = {}
                 for key,val in bibtex_field_entries:
                     # replace latex symbols with unicode characters
-                    # 1: latex, 2: combining unicode, 3: unicode, 4: plain
-                    for LV, CV, UV, PV in reference_toolkit.language_conversion():
-                        val = val.replace(LV,CV)
+                    val = _LATEX_RE.sub(lambda m:
+                        reference_toolkit.LATEX_TO_COMBINING[m.group(0)], val)
                     # add to current entry dictionary
                     entry[key.lower()] = val
                 # use search terms to find journals
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-smart_bibtex.py (11/2023)
+smart_bibtex.py (10/2026)
 Creates a bibtex entry using information from crossref.org
 
 Enter DOI's of journals to generate a bibtex entry with "universal" keys
@@ -29,6 +29,8 @@ NOTES:
         https://github.com/cparnot/universal-citekey-js
 
 UPDATE HISTORY:
+    Updated 10/2026: convert unicode characters with single str.translate passes
+        use the default ssl context created on first use
     Updated 11/2023: updated ssl context to fix deprecation errors
     Updated 05/2023: use pathlib to find and operate on paths
     Updated 09/2022: drop python2 compatibility
@@ -64,7 +66,7 @@ def smart_bibtex(doi, OUTPUT=False, VERBOSE=False):
     crossref = posixpath.join('https://api.crossref.org','works',
         urllib.parse.quote_plus(doi))
     request = urllib.request.Request(url=crossref)
-    context = reference_toolkit.utilities._default_ssl_context
+    context = reference_toolkit.utilities._get_default_ssl_context()
     response = urllib.request.urlopen(request, timeout=60, context=context)
     resp = json.loads(response.read())
 
@@ -160,13 +162,12 @@ def smart_bibtex(doi, OUTPUT=False, VERBOSE=False):
     # firstauthor: replace unicode characters with plain text
     # author_directory: replace unicode characters with combined unicode
     # bibtex entry for authors: replace unicode characters with latex symbols
-    # 1st column: latex, 2nd: combining unicode, 3rd: unicode, 4th: plain text
-    for LV, CV, UV, PV in reference_toolkit.language_conversion():
-        firstauthor = firstauthor.replace(UV, PV)
-        author_directory = author_directory.replace(UV, CV)
-        current_entry['author'] = current_entry['author'].replace(UV, LV)
-        current_entry['title'] = current_entry['title'].replace(UV, LV)
-        current_entry['journal'] = current_entry['journal'].replace(UV, LV)
+    firstauthor = firstauthor.translate(reference_toolkit.UNICODE_TO_PLAIN)
+    author_directory = author_directory.translate(
+        reference_toolkit.AUTHOR_NFD_TABLE)
+    for key in ('author','title','journal'):
+        current_entry[key] = current_entry[key].translate(
+            reference_toolkit.UNICODE_TO_LATEX)
 
     # remove line skips and series of whitespace from title
     current_entry['title'] = re.sub(r'\s+',' ',current_entry['title'])
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-smart_citekeys.py (11/2023)
+smart_citekeys.py (10/2026)
 Generates Papers2-like cite keys for BibTeX using information from crossref.org
 
 Enter DOI's of journals to generate "universal" keys
@@ -23,6 +23,8 @@ NOTES:
     Check unicode characters with http://www.fileformat.info/
 
 UPDATE HISTORY:
+    Updated 10/2026: convert unicode characters with single str.translate passes
+        use the default ssl context created on first use
     Updated 11/2023: updated ssl context to fix deprecation errors
     Updated 05/2023: use pathlib to find and operate on paths
     Updated 09/2022: drop python2 compatibility
@@ -54,7 +56,7 @@ def smart_citekey(doi):
     crossref = posixpath.join('https://api.crossref.org','works',
         urllib.parse.quote_plus(doi))
     request = urllib.request.Request(url=crossref)
-    context = reference_toolkit.utilities._default_ssl_context
+    context = reference_toolkit.utilities._get_default_ssl_context()
     response = urllib.request.urlopen(request, timeout=60, context=context)
     resp = json.loads(response.read())
 
@@ -62,9 +64,8 @@ def smart_citekey(doi):
     author = resp['message']['author'][0]['family']
     # check if author fields are initially uppercase: change to title
     author = author.title() if author.isupper() else author
-    # 1st column: latex, 2nd: combining unicode, 3rd: unicode, 4th: plain text
-    for LV, CV, UV, PV in reference_toolkit.language_conversion():
-        author = author.replace(UV, PV)
+    # replace unicode characters with plain text
+    author = author.translate(reference_toolkit.UNICODE_TO_PLAIN)
     # replace symbols
     author = re.sub(b'\s|\-|\'',b'',author.encode('utf-8')).decode('utf-8')
 
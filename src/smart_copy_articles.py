@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-smart_copy_articles.py (11/2023)
+smart_copy_articles.py (10/2026)
 Copies journal articles and supplements from a website to a local directory
      using information from crossref.org
 
@@ -30,6 +30,10 @@ NOTES:
         unicode characters with http://www.fileformat.info/
 
 UPDATE HISTORY:
+    Updated 10/2026: precompile regular expression for scrubbing url queries
+        increase chunk size for copying remote files to 128 KiB
+        convert unicode characters with single str.translate passes
+        use the default ssl context created on first use
     Updated 11/2023: updated ssl context to fix deprecation errors
     Updated 05/2023: use pathlib to find and operate on paths
     Updated 09/2022: drop python2 compatibility
@@ -54,13 +58,16 @@ import urllib.parse
 import urllib.request
 import reference_toolkit
 
+# regular expression for scrubbing additional html information from urls
+_QS_RE = re.compile(r'\?[\_a-z]{1,4}\=(.*?)$')
+
 # PURPOSE: create directories and copy a reference file after formatting
 def smart_copy_articles(remote_file,doi,SUPPLEMENT):
     # get reference filepath and reference format from referencerc file
     referencerc = reference_toolkit.get_data_path(['assets','.referencerc'])
     datapath, dataformat = reference_toolkit.read_referencerc(referencerc)
     # input remote file scrubbed of any additional html information
-    fi = pathlib.Path(re.sub(r'\?[\_a-z]{1,4}\=(.*?)$','',remote_file))
+    fi = pathlib.Path(_QS_RE.sub('',remote_file))
     # get extension from file (assume pdf if extension cannot be extracted)
     fileExtension = fi.suffix if fi.suffix else '.pdf'
 
@@ -68,7 +75,7 @@ def smart_copy_articles(remote_file,doi,SUPPLEMENT):
     crossref = posixpath.join('https://api.crossref.org','works',
         urllib.parse.quote_plus(doi))
     request = urllib.request.Request(url=crossref)
-    context = reference_toolkit.utilities._default_ssl_context
+    context = reference_toolkit.utilities._get_default_ssl_context()
     response = urllib.request.urlopen(request, timeout=60, context=context)
     resp = json.loads(response.read())
 
@@ -78,10 +85,10 @@ def smart_copy_articles(remote_file,doi,SUPPLEMENT):
     author = author.title() if author.isupper() else author
     # get journal name
     journal, = resp['message']['container-title']
-    # 1st column: latex, 2nd: combining unicode, 3rd: unicode, 4th: plain text
-    for LV, CV, UV, PV in reference_toolkit.language_conversion():
-        author = author.replace(UV, CV)
-        journal = journal.replace(UV, PV)
+    # author: replace unicode characters with combined unicode
+    # journal: replace unicode characters with plain text
+    author = author.translate(reference_toolkit.AUTHOR_NFD_TABLE)
+    journal = journal.translate(reference_toolkit.UNICODE_TO_PLAIN)
     # remove spaces, dashes and apostrophes
     author = re.sub('\s','_',author); author = re.sub(r'\-|\'','',author)
 
@@ -138,7 +145,7 @@ def smart_copy_articles(remote_file,doi,SUPPLEMENT):
     local_file = directory.joinpath(dataformat.format(*args))
 
     # chunked transfer encoding size
-    CHUNK = 16 * 1024
+    CHUNK = 128 * 1024
     # open url and copy contents to local file using chunked transfer encoding
     # transfer should work properly with ascii and binary data formats
     headers = {'User-Agent':"Magic Browser"}
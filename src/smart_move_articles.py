@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-smart_move_articles.py (11/2023)
+smart_move_articles.py (10/2026)
 Moves journal articles and supplements to the reference local directory
     using information from crossref.org
 
@@ -34,6 +34,8 @@ NOTES:
         unicode characters with http://www.fileformat.info/
 
 UPDATE HISTORY:
+    Updated 10/2026: convert unicode characters with single str.translate passes
+        use the default ssl context created on first use
     Updated 11/2023: updated ssl context to fix deprecation errors
     Updated 05/2023: use pathlib to find and operate on paths
     Updated 09/2022: drop python2 compatibility
@@ -70,7 +72,7 @@ def smart_move_articles(fi,doi,SUPPLEMENT,CLEANUP):
     crossref = posixpath.join('https://api.crossref.org','works',
         urllib.parse.quote_plus(doi))
     request = urllib.request.Request(url=crossref)
-    context = reference_toolkit.utilities._default_ssl_context
+    context = reference_toolkit.utilities._get_default_ssl_context()
     response = urllib.request.urlopen(request, timeout=60, context=context)
     resp = json.loads(response.read())
 
@@ -80,10 +82,10 @@ def smart_move_articles(fi,doi,SUPPLEMENT,CLEANUP):
     author = author.title() if author.isupper() else author
     # get journal name
     journal, = resp['message']['container-title']
-    # 1st column: latex, 2nd: combining unicode, 3rd: unicode, 4th: plain text
-    for LV, CV, UV, PV in reference_toolkit.language_conversion():
-        author = author.replace(UV, CV)
-        journal = journal.replace(UV, PV)
+    # author: replace unicode characters with combined unicode
+    # journal: replace unicode characters with plain text
+    author = author.translate(reference_toolkit.AUTHOR_NFD_TABLE)
+    journal = journal.translate(reference_toolkit.UNICODE_TO_PLAIN)
     # remove spaces, dashes and apostrophes
     author = re.sub(r'\s','_',author); author = re.sub('\-|\'','',author)
 
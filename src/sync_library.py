@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-sync_library.py (05/2023)
+sync_library.py (10/2026)
 Exports complete library into a new directory (such as a mounted-drive)
 Will only copy new or overwritten files by checking the last modified dates
 
@@ -21,6 +21,7 @@ PROGRAM DEPENDENCIES:
     utilities.py: Sets default file path and file format for output files
 
 UPDATE HISTORY:
+    Updated 10/2026: check for supplementary directories with a single stat
     Updated 05/2023: use pathlib to find and operate on paths
     Updated 12/2020: using argparse to set command line options
     Updated 02/2019: added option list to only print the files to be transferred
@@ -64,7 +65,7 @@ def sync_library(DIRECTORY, PULL=False, LIST=False, VERBOSE=False,
                     CLOBBER=CLOBBER, VERBOSE=VERBOSE, MODE=MODE)
             # if there is supplementary information
             SI = A.joinpath(S)
-            if SI.exists() and SI.is_dir():
+            if SI.is_dir():
                 # find supplementary files within Supplemental directory
                 FILES = [fi for fi in SI.iterdir() if re.match(regex,fi.name)]
                 # transfer each supplementary file (check if existing)